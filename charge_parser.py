@@ -11,11 +11,25 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import heapq
+import io
+import math
+import operator
+import os
+import socket
+import stat
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from multiprocessing.connection import Client, Connection
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Union
 
 try:
     import easyocr
@@ -23,6 +37,20 @@ try:
 except ImportError:
     EASYOCR_AVAILABLE = False
 
+try:
+    # Installed alongside EasyOCR; only used to convert formats EasyOCR cannot decode.
+    from PIL import Image
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+
+try:
+    # Optional: teaches Pillow to open iPhone .heic screenshots.
+    from pillow_heif import register_heif_opener
+    register_heif_opener()
+except ImportError:
+    pass
+
 from plugins import (
     ChargingAppPlugin,
     discover_plugins,
@@ -33,6 +61,11 @@ from plugins import (
 from plugins.fordpass import FordPassPlugin, extract_record_from_text as fordpass_extract
 
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".heic", ".tif", ".tiff", ".bmp"}
+# Tuple form for str.endswith, which matches all suffixes in a single C-level call.
+IMAGE_SUFFIXES = tuple(sorted(IMAGE_EXTENSIONS))
+
+# Tesseract separates the text of each page/image in its stdout stream with a form feed.
+PAGE_SEPARATOR = "\x0c"
 
 CSV_COLUMNS = [
     "date",
@@ -50,24 +83,82 @@ CSV_COLUMNS = [
     "cost",
 ]
 
+# Batched EasyOCR settings: every image is resized to a portrait phone-screenshot shape.
+EASYOCR_BATCH_MIN_IMAGES = 4
+EASYOCR_BATCH_WIDTH = 1080
+EASYOCR_BATCH_HEIGHT = 1920
+EASYOCR_BATCH_SIZE = 16
+# Threads used to read and decode screenshot files ahead of EasyOCR.
+IMAGE_READ_WORKERS = 16
+
+# `--daemon` keeps a warm EasyOCR reader in a background process behind this socket.
+DAEMON_ADDRESS = str(Path.home() / ".charge_parser.sock")
+DAEMON_IDLE_TIMEOUT = 600  # seconds without requests before the daemon exits
+DAEMON_START_TIMEOUT = 120  # seconds to wait for a fresh daemon to load its models
+DAEMON_POLL_INTERVAL = 1  # seconds between idle checks while waiting for a request
+
 # Global EasyOCR reader instance (initialized on first use)
 _easyocr_reader = None
+_easyocr_reader_lock = threading.Lock()
 
 
 def get_easyocr_reader():
     """Lazy initialization of EasyOCR reader."""
     global _easyocr_reader
     if _easyocr_reader is None and EASYOCR_AVAILABLE:
-        # Try to use GPU on macOS (MPS) if available, suppress pin_memory warnings
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", message=".*pin_memory.*")
-            # EasyOCR will automatically detect and use MPS on Apple Silicon
-            _easyocr_reader = easyocr.Reader(['en'], gpu=True, verbose=False)
+        # Loading the models takes seconds; make sure concurrent callers only do it once.
+        with _easyocr_reader_lock:
+            if _easyocr_reader is None:
+                # Try to use GPU on macOS (MPS) if available, suppress pin_memory warnings
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore", message=".*pin_memory.*")
+                    # EasyOCR will automatically detect and use MPS on Apple Silicon
+                    # Batched runs resize every image to the same shape, which lets cuDNN
+                    # cache its fastest kernels.
+                    _easyocr_reader = easyocr.Reader(['en'], gpu=True, verbose=False, cudnn_benchmark=True)
     return _easyocr_reader
 
 
-def run_easyocr(image_path: Path) -> str:
-    """Run EasyOCR on the image and return the extracted text."""
+# EasyOCR accepts a path or the encoded file contents.
+ImageSource = Union[Path, bytes]
+
+# Suffixes EasyOCR's OpenCV decoder cannot read; Pillow (with pillow-heif) converts them.
+PILLOW_ONLY_SUFFIXES = {".heic"}
+
+
+def _easyocr_input(image: ImageSource) -> Union[str, bytes]:
+    return str(image) if isinstance(image, Path) else image
+
+
+def load_image(image_path: Path) -> ImageSource:
+    """
+    Read an image's file contents for EasyOCR, which decodes them itself.
+
+    Formats OpenCV cannot decode (HEIC) are re-encoded as PNG with Pillow when it is
+    available, so EasyOCR sees the same pixels it would get from a PNG screenshot.
+    """
+    data = image_path.read_bytes()
+    if not PILLOW_AVAILABLE or image_path.suffix.lower() not in PILLOW_ONLY_SUFFIXES:
+        return data
+    with Image.open(io.BytesIO(data)) as image:
+        converted = io.BytesIO()
+        image.convert("RGB").save(converted, format="PNG")
+    return converted.getvalue()
+
+
+def load_images(image_paths: Sequence[Path]) -> List[ImageSource]:
+    """
+    Load all images concurrently so disk reads (and any HEIC conversion, during which
+    Pillow releases the GIL) overlap.
+    """
+    if len(image_paths) <= 1:
+        return [load_image(image_path) for image_path in image_paths]
+    with ThreadPoolExecutor(max_workers=min(IMAGE_READ_WORKERS, len(image_paths))) as executor:
+        return list(executor.map(load_image, image_paths))
+
+
+def run_easyocr(image_path: ImageSource) -> str:
+    """Run EasyOCR on the image (a path or its file contents) and return the text."""
     reader = get_easyocr_reader()
     if reader is None:
         raise RuntimeError("EasyOCR not available")
@@ -75,32 +166,117 @@ def run_easyocr(image_path: Path) -> str:
     # Suppress pin_memory warnings on MPS (macOS)
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message=".*pin_memory.*")
-        result = reader.readtext(str(image_path), detail=0)
+        result = reader.readtext(_easyocr_input(image_path), detail=0)
     return "\n".join(result)
 
 
-def run_tesseract(image_path: Path, psm: str) -> str:
-    """Run tesseract on the image and return the extracted text."""
+def run_easyocr_batch(
+    image_paths: Sequence[ImageSource],
+    n_width: int = EASYOCR_BATCH_WIDTH,
+    n_height: int = EASYOCR_BATCH_HEIGHT,
+    batch_size: int = EASYOCR_BATCH_SIZE,
+) -> List[str]:
+    """
+    Run EasyOCR over several images at once and return the text for each, in order.
+
+    Images are resized to `n_width` x `n_height` so they can be stacked into batches of
+    `batch_size` for the detection and recognition models.
+    """
+    reader = get_easyocr_reader()
+    if reader is None:
+        raise RuntimeError("EasyOCR not available")
+
+    # Suppress pin_memory warnings on MPS (macOS)
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=".*pin_memory.*")
+        results = reader.readtext_batched(
+            [_easyocr_input(image_path) for image_path in image_paths],
+            n_width=n_width,
+            n_height=n_height,
+            batch_size=batch_size,
+            detail=0,
+        )
+    return ["\n".join(result) for result in results]
+
+
+def _tesseract_command(source: str, psm: str) -> List[str]:
+    return [
+        "tesseract",
+        source,
+        "stdout",
+        "--psm", psm,
+        "--oem", "1",  # Use LSTM engine only (better for modern screenshots)
+        # Pin the separator so batch output splits the same regardless of user configs.
+        "-c", f"page_separator={PAGE_SEPARATOR}",
+    ]
+
+
+def _single_threaded_env() -> Dict[str, str]:
+    """Environment that keeps tesseract's OpenMP to one thread per process."""
+    return {**os.environ, "OMP_THREAD_LIMIT": "1"}
+
+
+def _invoke_tesseract(source: str, psm: str, env: Optional[Mapping[str, str]]) -> str:
+    """
+    Run tesseract on `source` (an image or a file listing images) and return its stdout.
+
+    Output is captured as bytes and decoded once as UTF-8, independent of the locale.
+    """
     try:
         result = subprocess.run(
-            [
-                "tesseract",
-                str(image_path),
-                "stdout",
-                "--psm", psm,
-                "--oem", "1",  # Use LSTM engine only (better for modern screenshots)
-            ],
+            _tesseract_command(source, psm),
             check=True,
             capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            close_fds=True,
+            env=env,
         )
     except FileNotFoundError as exc:  # pragma: no cover - depends on environment
         raise RuntimeError(
             "tesseract binary not found. Install it (e.g. `brew install tesseract`)."
         ) from exc
+    return result.stdout.decode("utf-8", "replace")
+
+
+def run_tesseract(image_path: Path, psm: str, env: Optional[Mapping[str, str]] = None) -> str:
+    """Run tesseract on the image and return the extracted text."""
+    try:
+        return _invoke_tesseract(str(image_path), psm, env)
     except subprocess.CalledProcessError as exc:  # pragma: no cover - depends on OCR input
-        raise RuntimeError(f"OCR failed for {image_path}: {exc.stderr}") from exc
-    return result.stdout
+        stderr = exc.stderr.decode("utf-8", "replace") if exc.stderr else ""
+        raise RuntimeError(f"OCR failed for {image_path}: {stderr}") from exc
+
+
+def run_tesseract_batch(
+    image_paths: Sequence[Path], psm: str, env: Optional[Mapping[str, str]] = None
+) -> List[str]:
+    """
+    Run tesseract once over several images and return the text for each, in order.
+
+    Tesseract accepts a text file listing one image per line, which avoids paying the
+    process start-up and model load for every screenshot. If the batch run fails or the
+    output does not split into exactly one page per image, each image is OCR'd on its own.
+    """
+    if len(image_paths) == 1:
+        return [run_tesseract(image_paths[0], psm, env=env)]
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as listing:
+        listing.write("\n".join(str(path) for path in image_paths))
+    try:
+        output = _invoke_tesseract(listing.name, psm, env)
+    except subprocess.CalledProcessError:
+        # Re-run individually so the error points at the offending image.
+        return [run_tesseract(path, psm, env=env) for path in image_paths]
+    finally:
+        os.unlink(listing.name)
+    pages = output.split(PAGE_SEPARATOR)
+    # Each image must account for exactly one page; the separator after the last page
+    # leaves an empty trailing piece. Anything else (e.g. a multi-page TIFF in the list)
+    # means pages cannot be matched to images.
+    if len(pages) == len(image_paths) + 1 and not pages[-1].strip():
+        pages.pop()
+    if len(pages) != len(image_paths):
+        return [run_tesseract(path, psm, env=env) for path in image_paths]
+    return pages
 
 
 def run_ocr(image_path: Path, psm: str, use_easyocr: bool = True) -> str:
@@ -120,53 +296,291 @@ def run_ocr(image_path: Path, psm: str, use_easyocr: bool = True) -> str:
     return run_tesseract(image_path, psm)
 
 
+def _ocr_chunk(image_paths: Sequence[Path], psm: str) -> List[str]:
+    """Worker: OCR one contiguous chunk of images with single-threaded tesseract."""
+    return run_tesseract_batch(image_paths, psm, env=_single_threaded_env())
+
+
+def run_ocr_many(image_paths: Sequence[Path], psm: str, use_easyocr: bool = True) -> List[str]:
+    """
+    Run OCR over all images, returning the texts in the same order as `image_paths`.
+
+    With tesseract, the images are split into one contiguous chunk per CPU and each chunk
+    is batched through a single-threaded tesseract process, which scales better than
+    tesseract's own OpenMP threading. Threads are enough to drive the processes since
+    they only wait on the subprocess. EasyOCR uses its batched API for larger sets and
+    otherwise prefetches the next images while the current one is recognized.
+
+    Batching resizes every image to EASYOCR_BATCH_WIDTH x EASYOCR_BATCH_HEIGHT, while
+    fewer than EASYOCR_BATCH_MIN_IMAGES are OCR'd at their own size, so EasyOCR text for
+    the same screenshot can differ slightly between small and large runs.
+    """
+    if use_easyocr and EASYOCR_AVAILABLE:
+        if len(image_paths) >= EASYOCR_BATCH_MIN_IMAGES:
+            # One batch at a time, so only EASYOCR_BATCH_SIZE screenshots are held in
+            # memory (and decoded by EasyOCR) at once, however many were passed.
+            batched_texts: List[str] = []
+            for start in range(0, len(image_paths), EASYOCR_BATCH_SIZE):
+                batch = image_paths[start : start + EASYOCR_BATCH_SIZE]
+                batched_texts.extend(run_easyocr_batch(load_images(batch)))
+            return batched_texts
+        if len(image_paths) <= 1:
+            return [run_easyocr(load_image(image_path)) for image_path in image_paths]
+        # executor.map yields in order as each decode finishes, so OCR of the first
+        # image starts while the following ones are still being read and decoded.
+        with ThreadPoolExecutor(max_workers=len(image_paths)) as executor:
+            return [run_easyocr(image) for image in executor.map(load_image, image_paths)]
+    if len(image_paths) <= 1:
+        return [run_tesseract(image_path, psm) for image_path in image_paths]
+    workers = min(os.cpu_count() or 1, len(image_paths))
+    if workers == 1:
+        return run_tesseract_batch(image_paths, psm)
+    size = math.ceil(len(image_paths) / workers)
+    chunks = [image_paths[start : start + size] for start in range(0, len(image_paths), size)]
+    texts: List[str] = []
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        for chunk_texts in executor.map(_ocr_chunk, chunks, [psm] * len(chunks)):
+            texts.extend(chunk_texts)
+    return texts
+
+
+def serve_easyocr(address: str = DAEMON_ADDRESS, idle_timeout: float = DAEMON_IDLE_TIMEOUT) -> None:
+    """
+    Keep an EasyOCR reader loaded and answer OCR requests on a Unix socket.
+
+    Each connection sends a list of image path strings and receives `("ok", texts)` or
+    `("error", message)`. The server exits after `idle_timeout` seconds without requests,
+    or straight away if another daemon is already answering on `address`.
+    """
+    if get_easyocr_reader() is None:
+        raise RuntimeError("EasyOCR not available")
+    # Two runs can start a daemon at the same time; the later one must not take over the
+    # socket of one that is already serving.
+    if _daemon_is_running(address):
+        return
+    if os.path.exists(address):
+        os.unlink(address)  # left behind by a daemon that died
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Owner-only socket: requests are unpickled, so nobody else may connect.
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(address)
+    finally:
+        os.umask(old_umask)
+    bound = os.stat(address)
+    server.listen()
+    # accept() wakes up regularly to check the idle time, so stopping never depends on a
+    # connection arriving through the (possibly replaced) socket path.
+    server.settimeout(min(DAEMON_POLL_INTERVAL, idle_timeout))
+
+    last_used = time.monotonic()
+    try:
+        while time.monotonic() - last_used < idle_timeout:
+            try:
+                client, _ = server.accept()
+            except socket.timeout:
+                continue
+            client.setblocking(True)
+            try:
+                with Connection(client.detach()) as conn:
+                    _answer_ocr_request(conn)
+            except OSError:
+                pass  # the client went away before its reply (e.g. Ctrl-C during OCR)
+            last_used = time.monotonic()
+    finally:
+        server.close()
+        # Only remove the socket file if it is still ours.
+        try:
+            current = os.stat(address)
+        except FileNotFoundError:
+            pass
+        else:
+            if (current.st_dev, current.st_ino) == (bound.st_dev, bound.st_ino):
+                os.unlink(address)
+
+
+def _daemon_is_running(address: str) -> bool:
+    try:
+        Client(address, family="AF_UNIX").close()
+    except OSError:
+        return False
+    return True
+
+
+def _answer_ocr_request(conn: Connection) -> None:
+    try:
+        paths = conn.recv()
+    except EOFError:
+        return
+    except Exception:  # a malformed request must not stop the daemon for everyone else
+        return
+    try:
+        texts = run_ocr_many([Path(path) for path in paths], psm="6")
+    except Exception as exc:  # report to the client instead of killing the daemon
+        conn.send(("error", str(exc)))
+        return
+    conn.send(("ok", texts))
+
+
+def _connect_to_daemon(address: str) -> Connection:
+    """Connect to the OCR daemon, starting one in the background if none is running."""
+    try:
+        return Client(address, family="AF_UNIX")
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+    subprocess.Popen(
+        [sys.executable, "-c", f"import charge_parser; charge_parser.serve_easyocr({address!r})"],
+        cwd=Path(__file__).resolve().parent,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while True:
+        try:
+            return Client(address, family="AF_UNIX")
+        except (FileNotFoundError, ConnectionRefusedError):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"OCR daemon did not start listening on {address}") from None
+            time.sleep(0.2)
+
+
+def run_easyocr_via_daemon(image_paths: Sequence[Path], address: str = DAEMON_ADDRESS) -> List[str]:
+    """OCR the images with the shared EasyOCR daemon and return the texts in order."""
+    with _connect_to_daemon(address) as conn:
+        # The daemon runs from this script's directory, so relative paths would not resolve.
+        conn.send([os.path.abspath(image_path) for image_path in image_paths])
+        status, payload = conn.recv()
+    if status != "ok":
+        raise RuntimeError(f"OCR daemon failed: {payload}")
+    return payload
+
+
+def _file_identity(path: str, stat_result: os.stat_result) -> Hashable:
+    """Return a key identifying the file (or directory) behind `path`, however it is spelled."""
+    if os.name == "nt" or not stat_result.st_ino:
+        # No stable inode numbers; compare normalized absolute paths instead.
+        return os.path.normcase(os.path.abspath(path))
+    return (stat_result.st_dev, stat_result.st_ino)
+
+
+def _has_image_suffix(name: str) -> bool:
+    """Same answer as `os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS`, cheaper."""
+    # endswith rejects most non-images straight away. The second test only runs for
+    # matches: it keeps splitext's rule that a leading dot (".png") is not an extension.
+    return name.lower().endswith(IMAGE_SUFFIXES) and "." in name.lstrip(".")
+
+
 def gather_image_paths(paths: Iterable[Path]) -> List[Path]:
     """Expand file/directory arguments into a concrete list of image paths."""
-    collected: List[Path] = []
+    # Plain strings while walking; Path objects are only built for the returned list.
+    collected: List[str] = []
     seen = set()
-
-    def _collect_directory(directory: Path) -> None:
-        for child in sorted(directory.iterdir(), key=lambda p: (p.is_dir(), p.name.lower())):
-            if child.is_file():
-                if child.suffix.lower() in IMAGE_EXTENSIONS:
-                    norm = child.resolve()
-                    if norm not in seen:
-                        seen.add(norm)
-                        collected.append(norm)
+    # Identity (see _file_identity) of every directory already walked.
+    visited: Set[Hashable] = set()
+
+    def _collect_directory(root: str, root_stat: os.stat_result) -> None:
+        # Walks with an explicit stack rather than recursion (os.walk-style), but keeps
+        # scandir's DirEntry objects, which os.walk hides: they cache the file type and
+        # inode from the directory read, so is_file()/is_dir() and the dedup key don't
+        # cost a stat() per entry (except for symlinks). Within each directory images
+        # come first, then subdirectories, each by case-insensitive name.
+        pending = [(root, root_stat)]
+        while pending:
+            directory, directory_stat = pending.pop()
+            # A directory reached again (through a symlink cycle or a second link to it)
+            # can only yield files already collected, so it is walked once. Checked when
+            # popped, not when pushed, to keep the depth-first order.
+            directory_key = _file_identity(directory, directory_stat)
+            if directory_key in visited:
                 continue
-            if child.is_dir():
-                _collect_directory(child)
-
+            visited.add(directory_key)
+            device = directory_stat.st_dev
+            images = []
+            subdirs = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        # Broken or looping symlinks raise here (ELOOP); like Path.is_file()
+                        # and is_dir(), treat them as neither instead of failing the run.
+                        try:
+                            if entry.is_file():
+                                if _has_image_suffix(entry.name):
+                                    images.append(entry)
+                            elif entry.is_dir():
+                                subdirs.append(entry)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            images.sort(key=lambda entry: entry.name.lower())
+            for entry in images:
+                if not stat_walked_files and os.name != "nt" and not entry.is_symlink():
+                    # A regular file lives on its directory's device and DirEntry.inode()
+                    # comes from the directory read, so no stat() is needed. Keys are only
+                    # compared within the walk; a file bind-mounted into a walked directory
+                    # can still be collected a second time through its other path.
+                    key: Hashable = (device, entry.inode())
+                else:
+                    key = _file_identity(entry.path, entry.stat())
+                if key not in seen:
+                    seen.add(key)
+                    collected.append(entry.path)
+            # Pushed in reverse so the first subdirectory is walked next, exactly the
+            # order the depth-first recursion produced.
+            subdirs.sort(key=lambda entry: entry.name.lower())
+            for entry in reversed(subdirs):
+                try:
+                    pending.append((entry.path, entry.stat()))
+                except OSError:
+                    continue
+
+    path_stats = []
     for path in paths:
-        if not path.exists():
-            raise SystemExit(f"Input path not found: {path}")
-        if path.is_file():
+        try:
+            path_stats.append((path, path.stat()))
+        except FileNotFoundError:
+            raise SystemExit(f"Input path not found: {path}") from None
+    # DirEntry.inode() is the directory entry's d_ino, which not every filesystem makes
+    # equal to stat()'s st_ino (overlayfs without xino, bind-mounted files). Files passed
+    # explicitly are keyed by stat(), so when there are any, walked files are too.
+    stat_walked_files = any(stat.S_ISREG(stat_result.st_mode) for _, stat_result in path_stats)
+
+    for path, stat_result in path_stats:
+        if stat.S_ISREG(stat_result.st_mode):
             ext = path.suffix.lower()
             if ext in IMAGE_EXTENSIONS:
-                norm = path.resolve()
-                if norm not in seen:
-                    seen.add(norm)
-                    collected.append(norm)
+                key = _file_identity(str(path), stat_result)
+                if key not in seen:
+                    seen.add(key)
+                    collected.append(str(path))
             else:
                 raise SystemExit(f"Unsupported file type: {path}")
             continue
-        if path.is_dir():
-            _collect_directory(path)
+        if stat.S_ISDIR(stat_result.st_mode):
+            _collect_directory(str(path), stat_result)
             continue
         raise SystemExit(f"Unsupported path: {path}")
-    return collected
+    return [Path(path) for path in collected]
 
 
-def load_existing_rows(output_path: Path) -> List[Dict[str, str]]:
+def iter_existing_rows(output_path: Path) -> Iterator[Dict[str, str]]:
+    """Yield the rows of an existing CSV one at a time, normalized to `CSV_COLUMNS`."""
     if not output_path.exists():
-        return []
+        return
     with output_path.open("r", newline="", encoding="utf-8") as handle:
         reader = csv.DictReader(handle)
-        existing = []
+        if reader.fieldnames == CSV_COLUMNS:
+            # Written by this tool: rows already carry exactly the expected keys.
+            yield from reader
+            return
         for row in reader:
-            normalized = {column: row.get(column, "") for column in CSV_COLUMNS}
-            existing.append(normalized)
-        return existing
+            yield {column: row.get(column, "") for column in CSV_COLUMNS}
+
+
+def load_existing_rows(output_path: Path) -> List[Dict[str, str]]:
+    return list(iter_existing_rows(output_path))
 
 
 def extract_record_from_text(text: str) -> Dict[str, str]:
@@ -210,16 +624,49 @@ def resolve_plugin_for_text(
     return prompt_user_for_plugin(plugins, image_path)
 
 
+def _is_ascii_digits(text: str) -> bool:
+    return text.isascii() and text.isdigit()
+
+
+def _fast_row_datetime(date_str: str, time_str: str) -> Optional[datetime]:
+    """Parse the `YYYY-MM-DD` + optional `H:MM`/`HH:MM` shape this tool writes, by slicing."""
+    if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+        return None
+    year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+    if not (_is_ascii_digits(year) and _is_ascii_digits(month) and _is_ascii_digits(day)):
+        return None
+    hour = minute = "0"
+    if time_str:
+        hour, sep, minute = time_str.partition(":")
+        if not sep or len(minute) != 2 or len(hour) not in (1, 2):
+            return None
+        if not (_is_ascii_digits(hour) and _is_ascii_digits(minute)):
+            return None
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_row_datetime(date_str: str, time_str: str) -> Optional[datetime]:
     if not date_str:
         return None
-    time_formats = ["%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %I:%M %p", "%Y-%m-%d %I:%M%p"]
+    fast = _fast_row_datetime(date_str, time_str)
+    if fast is not None:
+        return fast
     if time_str:
-        for fmt in time_formats:
-            try:
-                return datetime.strptime(f"{date_str} {time_str}", fmt)
-            except ValueError:
-                continue
+        # Pick the one format the time's shape allows instead of trying each in turn.
+        if time_str[-2:].lower() in ("am", "pm"):
+            fmt = "%Y-%m-%d %I:%M %p" if time_str[-3:-2].isspace() else "%Y-%m-%d %I:%M%p"
+        elif time_str.count(":") == 2:
+            fmt = "%Y-%m-%d %H:%M:%S"
+        else:
+            fmt = "%Y-%m-%d %H:%M"
+        try:
+            return datetime.strptime(f"{date_str} {time_str}", fmt)
+        except ValueError:
+            pass
     try:
         return datetime.strptime(date_str, "%Y-%m-%d")
     except ValueError:
@@ -237,42 +684,55 @@ def row_sort_key(row: Dict[str, str]) -> tuple:
     return (dt_value, location, name)
 
 
+def dedup_key(row: Dict[str, str]) -> tuple:
+    return (
+        row.get("date") or "",
+        row.get("charger_location") or "",
+        row.get("start_time") or "",
+    )
+
+
 def write_csv(output_path: Path, rows: Iterable[Dict[str, str]], append: bool) -> int:
     """Write the rows to the CSV file and return the number of new rows added."""
-    existing_rows = load_existing_rows(output_path) if append else []
-    combined = []
-    seen_keys = set()
-
-    def dedup_key(row: Dict[str, str]) -> tuple:
-        return (
-            row.get("date") or "",
-            row.get("charger_location") or "",
-            row.get("start_time") or "",
-        )
-
-    for row in existing_rows:
-        key = dedup_key(row)
-        seen_keys.add(key)
-        combined.append(row)
+    seen = set()
+    # Existing rows are decorated with their sort key as they stream in; a file this
+    # tool wrote is already in order, which is checked on the way.
+    existing: List[tuple] = []
+    existing_sorted = True
+    if append:
+        for row in iter_existing_rows(output_path):
+            key = dedup_key(row)
+            if key in seen:
+                continue
+            seen.add(key)
+            sort_key = row_sort_key(row)
+            if existing_sorted and existing and sort_key < existing[-1][0]:
+                existing_sorted = False
+            existing.append((sort_key, row))
 
-    added = 0
+    new: List[tuple] = []
     for row in rows:
         key = dedup_key(row)
-        if key in seen_keys:
-            continue
-        seen_keys.add(key)
-        combined.append(row)
-        added += 1
-
-    combined.sort(key=row_sort_key)
+        if key not in seen:
+            seen.add(key)
+            new.append((row_sort_key(row), row))
+    new.sort(key=operator.itemgetter(0))
+
+    if existing_sorted:
+        # Only the new rows needed sorting; merge them into the ordered file in one
+        # pass. Ties keep existing rows first, as the stable sort below does.
+        ordered: Iterable[tuple] = heapq.merge(existing, new, key=operator.itemgetter(0))
+    else:
+        existing.extend(new)
+        existing.sort(key=operator.itemgetter(0))
+        ordered = existing
 
     with output_path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        for row in combined:
-            writer.writerow(row)
+        writer = csv.writer(handle)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(tuple(row.get(column, "") for column in CSV_COLUMNS) for _, row in ordered)
 
-    return added
+    return len(new)
 
 
 def parse_args() -> argparse.Namespace:
@@ -312,6 +772,11 @@ def parse_args() -> argparse.Namespace:
         dest="plugin_name",
         help="Force a specific plugin by name (e.g. 'fordpass') instead of auto-detecting.",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run EasyOCR in a background process that stays warm between invocations.",
+    )
     return parser.parse_args()
 
 
@@ -321,15 +786,25 @@ def main() -> None:
     image_paths = gather_image_paths(args.inputs)
     if not image_paths and not args.text_only:
         raise SystemExit("No images found in the provided paths.")
-    plugins = available_plugins()
     forced_plugin: Optional[ChargingAppPlugin] = None
+    plugins: List[ChargingAppPlugin] = []
     if args.plugin_name:
-        forced_plugin = get_plugin_by_name(args.plugin_name, plugins)
+        # Looked up by name so the other plugin modules are never imported.
+        forced_plugin = get_plugin_by_name(args.plugin_name)
         if forced_plugin is None:
-            available = ", ".join(plugin.name for plugin in plugins)
+            available = ", ".join(plugin.name for plugin in available_plugins())
             raise SystemExit(f"Unknown plugin '{args.plugin_name}'. Available plugins: {available}")
-    for image in image_paths:
-        text = run_ocr(image, args.psm)
+    else:
+        plugins = available_plugins()
+    if args.daemon:
+        if not EASYOCR_AVAILABLE:
+            raise SystemExit("--daemon requires EasyOCR to be installed.")
+        if os.name == "nt":
+            raise SystemExit("--daemon is only supported on macOS and Linux.")
+        texts = run_easyocr_via_daemon(image_paths)
+    else:
+        texts = run_ocr_many(image_paths, args.psm)
+    for image, text in zip(image_paths, texts):
         if args.text_only:
             ocr_engine = "EasyOCR" if EASYOCR_AVAILABLE else "Tesseract"
             print(f"--- OCR output for {image} (using {ocr_engine}) ---\n{text}")
@@ -3,7 +3,7 @@
 Utility script to scaffold a charging-app plugin from a sample screenshot.
 
 The script OCRs the provided screenshot with tesseract and builds a plugin class
-with a detect() method seeded by common keywords. The parse() method is left as
+whose detection keywords are seeded from common words. The parse() method is left as
 a TODO for manual implementation.
 """
 
@@ -18,23 +18,19 @@ from typing import List
 from charge_parser import run_tesseract
 
 KEYWORD_MIN_LENGTH = 4
+_SLUG_SEPARATOR_PATTERN = re.compile(r"[_\-\s]+")
+_KEYWORD_PATTERN = re.compile(r"[A-Za-z]{%d,}" % KEYWORD_MIN_LENGTH)
 
 
 def slug_to_class_name(slug: str) -> str:
-    pattern = r"[_\-\s]+"
-    return "".join(part.capitalize() for part in re.split(pattern, slug) if part)
+    return "".join(part.capitalize() for part in _SLUG_SEPARATOR_PATTERN.split(slug) if part)
 
 
 def extract_keywords(text: str, limit: int) -> List[str]:
-    tokens = re.findall(r"[A-Za-z]{%d,}" % KEYWORD_MIN_LENGTH, text.lower())
-    counts = Counter(tokens)
-    keywords = []
-    for word, _ in counts.most_common():
-        if word not in keywords:
-            keywords.append(word)
-        if len(keywords) >= limit:
-            break
-    return keywords
+    # Stream the matches into the Counter rather than materializing a token list first.
+    counts = Counter(match.group(0) for match in _KEYWORD_PATTERN.finditer(text.lower()))
+    # Counter keys are already unique; most_common(limit) only ranks the top `limit`.
+    return [word for word, _ in counts.most_common(limit)]
 
 
 def render_plugin_source(class_name: str, plugin_name: str, display_name: str, keywords: List[str]) -> str:
@@ -47,14 +43,9 @@ KEYWORDS = [{keyword_literal}]
 class {class_name}(ChargingAppPlugin):
     name = "{plugin_name}"
     display_name = "{display_name}"
-
-    def detect(self, text: str) -> float:
-        lowered = text.lower()
-        score = 0.0
-        for token in KEYWORDS:
-            if token in lowered:
-                score += 1.0
-        return score
+    # Each keyword found in the OCR text adds 1.0 to the detection score; set `weights`
+    # to make some count for more.
+    keywords = tuple(KEYWORDS)
 
     def parse(self, text: str) -> dict:
         \"\"\"Parse OCR text into a CSV row for this app.\"\"\"
@@ -100,7 +91,7 @@ def parse_args() -> argparse.Namespace:
         "--keywords",
         type=int,
         default=6,
-        help="Maximum number of keywords to seed into detect().",
+        help="Maximum number of detection keywords to seed into the plugin.",
     )
     parser.add_argument(
         "--force",
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import functools
 import importlib
+import inspect
+import threading
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple, Type
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+try:
+    import ahocorasick  # type: ignore
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    AHOCORASICK_AVAILABLE = False
 
 
 class ChargingAppPlugin:
@@ -10,10 +20,36 @@ class ChargingAppPlugin:
 
     name: str = "base"
     display_name: str = "Base Plugin"
-
-    def detect(self, text: str) -> float:
-        """Return a confidence score based on the OCR text."""
-        raise NotImplementedError
+    # Keyword detection: each keyword found in the lowercased OCR text adds its weight
+    # (default 1.0) to the score once. `aliases` maps alternative spellings to the
+    # keyword they count as.
+    keywords: Tuple[str, ...] = ()
+    weights: Dict[str, float] = {}
+    aliases: Dict[str, str] = {}
+
+    def detect(self, text: str, lowered: Optional[str] = None) -> float:
+        """
+        Return a confidence score based on the OCR text.
+
+        `lowered` is `text.lower()`, computed once by `score_plugins` and shared across
+        plugins; implementations should fall back to lowering `text` themselves when it
+        is not provided. The default scores `keywords`.
+        """
+        if lowered is None:
+            lowered = text.lower()
+        if not self.aliases:
+            # Common case (every generated plugin): sum in one pass, no found-set needed.
+            return sum((self.weights.get(keyword, 1.0) for keyword in self.keywords if keyword in lowered), 0.0)
+        found = {self.aliases.get(spelling, spelling) for spelling in self.keyword_spellings() if spelling in lowered}
+        return self.keyword_score(found)
+
+    def keyword_spellings(self) -> Tuple[str, ...]:
+        """Every string whose presence counts towards a keyword: the keywords and their aliases."""
+        return self.keywords + tuple(self.aliases)
+
+    def keyword_score(self, found: Set[str]) -> float:
+        """Sum the weights of the keywords that were found, in `keywords` order."""
+        return sum((self.weights.get(keyword, 1.0) for keyword in self.keywords if keyword in found), 0.0)
 
     def parse(self, text: str) -> dict:
         """Extract a CSV row from OCR text."""
@@ -30,38 +66,165 @@ def _import_plugin_modules() -> None:
 
 
 def _all_subclasses(cls: Type[ChargingAppPlugin]) -> List[Type[ChargingAppPlugin]]:
+    """Return every subclass of `cls`, depth-first in definition order."""
     subclasses = []
-    for subclass in cls.__subclasses__():
+    # Explicit stack, pushed in reverse so the walk order matches a recursive pre-order.
+    pending = list(reversed(cls.__subclasses__()))
+    while pending:
+        subclass = pending.pop()
         subclasses.append(subclass)
-        subclasses.extend(_all_subclasses(subclass))  # type: ignore[arg-type]
+        pending.extend(reversed(subclass.__subclasses__()))
     return subclasses
 
 
-def discover_plugins() -> List[ChargingAppPlugin]:
-    """Load and instantiate all available plugin classes."""
+# Plugins are stateless, so each class is instantiated once and shared.
+_INSTANCES: Dict[Type[ChargingAppPlugin], ChargingAppPlugin] = {}
+# Result of the last discovery; guarded by the lock so concurrent callers scan once.
+_DISCOVERED: Optional[List[ChargingAppPlugin]] = None
+_DISCOVERY_LOCK = threading.Lock()
+
+
+def _plugin_instance(cls: Type[ChargingAppPlugin]) -> ChargingAppPlugin:
+    plugin = _INSTANCES.get(cls)
+    if plugin is None:
+        plugin = _INSTANCES[cls] = cls()
+    return plugin
+
+
+def discover_plugins(refresh: bool = False) -> List[ChargingAppPlugin]:
+    """
+    Load all available plugin classes and return their shared instances.
+
+    The package is only scanned on the first call; pass `refresh=True` to pick up plugin
+    modules or classes added since.
+    """
+    global _DISCOVERED
+    with _DISCOVERY_LOCK:
+        if _DISCOVERED is None or refresh:
+            _DISCOVERED = _discover_plugins()
+        return list(_DISCOVERED)
+
+
+def _discover_plugins() -> List[ChargingAppPlugin]:
     _import_plugin_modules()
     plugins = []
     seen: set[str] = set()
     for cls in _all_subclasses(ChargingAppPlugin):
         if cls is ChargingAppPlugin:
             continue
-        if cls.name in seen:
+        # Attributes are read from the instance: on a class compiled with mypyc,
+        # `cls.name` is a descriptor rather than the string.
+        plugin = _plugin_instance(cls)
+        if plugin.name in seen:
             continue
-        seen.add(cls.name)
-        plugins.append(cls())
+        seen.add(plugin.name)
+        plugins.append(plugin)
     plugins.sort(key=lambda plugin: plugin.name)
     return plugins
 
 
+def _uses_keyword_detection(plugin: ChargingAppPlugin) -> bool:
+    return bool(plugin.keywords) and type(plugin).detect is ChargingAppPlugin.detect
+
+
+@functools.lru_cache(maxsize=8)
+def _keyword_automaton(plugins: Tuple[ChargingAppPlugin, ...]):
+    """Build one Aho-Corasick automaton over the keywords of all keyword-detected plugins."""
+    owners: Dict[str, List[Tuple[int, str]]] = {}
+    for position, plugin in enumerate(plugins):
+        if not _uses_keyword_detection(plugin):
+            continue
+        for spelling in plugin.keyword_spellings():
+            owners.setdefault(spelling, []).append((position, plugin.aliases.get(spelling, spelling)))
+    if not owners:
+        return None
+    automaton = ahocorasick.Automaton()
+    for spelling, entries in owners.items():
+        automaton.add_word(spelling, entries)
+    automaton.make_automaton()
+    return automaton
+
+
+# Per plugin class: whether its detect() takes `lowered` (older plugins only take `text`).
+_DETECT_ACCEPTS_LOWERED: Dict[Type[ChargingAppPlugin], bool] = {}
+
+
+def _detect_accepts_lowered(plugin_type: Type[ChargingAppPlugin]) -> bool:
+    accepts = _DETECT_ACCEPTS_LOWERED.get(plugin_type)
+    if accepts is None:
+        accepts = _DETECT_ACCEPTS_LOWERED[plugin_type] = _signature_accepts_lowered(plugin_type.detect)
+    return accepts
+
+
+def _signature_accepts_lowered(detect: Callable[..., float]) -> bool:
+    try:
+        parameters = inspect.signature(detect).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    positional = 0
+    for parameter in parameters:
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            return True
+        if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+            positional += 1
+    # self, text, lowered
+    return positional >= 3
+
+
 def score_plugins(text: str, plugins: Sequence[ChargingAppPlugin]) -> List[Tuple[float, ChargingAppPlugin]]:
     scores: List[Tuple[float, ChargingAppPlugin]] = []
-    for plugin in plugins:
-        scores.append((plugin.detect(text), plugin))
+    lowered = text.lower()
+    automaton = _keyword_automaton(tuple(plugins)) if AHOCORASICK_AVAILABLE else None
+    if automaton is not None:
+        # A single scan over the text finds the keywords of every keyword-detected
+        # plugin at once, instead of one substring search per keyword per plugin.
+        found: Dict[int, Set[str]] = {}
+        for _, entries in automaton.iter(lowered):
+            for position, keyword in entries:
+                found.setdefault(position, set()).add(keyword)
+    for position, plugin in enumerate(plugins):
+        if automaton is not None and _uses_keyword_detection(plugin):
+            scores.append((plugin.keyword_score(found.get(position, set())), plugin))
+        elif _detect_accepts_lowered(type(plugin)):
+            scores.append((plugin.detect(text, lowered), plugin))
+        else:
+            scores.append((plugin.detect(text), plugin))
     scores.sort(key=lambda pair: pair[0], reverse=True)
     return scores
 
 
-def get_plugin_by_name(name: str, plugins: Sequence[ChargingAppPlugin]) -> Optional[ChargingAppPlugin]:
+def _load_plugin_module(name: str) -> Optional[ChargingAppPlugin]:
+    """Import only `plugins/<name>.py` and return the plugin it defines under that name."""
+    module_name = name.lower()
+    if not module_name.isidentifier() or module_name.startswith("_") or module_name == "base":
+        return None
+    if not (Path(__file__).parent / f"{module_name}.py").exists():
+        return None
+    module = importlib.import_module(f"{__name__.rsplit('.', 1)[0]}.{module_name}")
+    for cls in _all_subclasses(ChargingAppPlugin):
+        if cls.__module__ != module.__name__:
+            continue
+        # Read `name` from the instance; see _discover_plugins.
+        plugin = _plugin_instance(cls)
+        if plugin.name.lower() == module_name:
+            return plugin
+    return None
+
+
+def get_plugin_by_name(
+    name: str, plugins: Optional[Sequence[ChargingAppPlugin]] = None
+) -> Optional[ChargingAppPlugin]:
+    """
+    Find a plugin by name or display name (case-insensitive).
+
+    Without `plugins`, the module named after the plugin is tried first, so forcing a
+    plugin doesn't import every other plugin module; full discovery is the fallback.
+    """
+    if plugins is None:
+        plugin = _load_plugin_module(name)
+        if plugin is not None:
+            return plugin
+        plugins = discover_plugins()
     lowered = name.lower()
     for plugin in plugins:
         if lowered in {plugin.name.lower(), plugin.display_name.lower()}:
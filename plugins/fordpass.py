@@ -1,20 +1,77 @@
 from __future__ import annotations
 
+import functools
 import re
-from datetime import datetime
-from typing import Dict, List
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
 from .base import ChargingAppPlugin
 
+# DATE_PATTERN and PERCENT_PATTERN use [^\S\n] instead of \s so matches never span lines.
 DATE_PATTERN = re.compile(
     r"(January|February|March|April|May|June|July|August|September|October|November|December)"
-    r"\s+((?:\d{1,2})(?:st|nd|rd|th)?|[iI]st)(?:,\s*|\s+)(\d{4})",
+    r"[^\S\n]+((?:\d{1,2})(?:st|nd|rd|th)?|[iI]st)(?:,[^\S\n]*|[^\S\n]+)(\d{4})",
     re.IGNORECASE,
 )
 TIME_PATTERN = re.compile(r"\b\d{1,2}[:.]\d{2}\b")
-PERCENT_PATTERN = re.compile(r"(\d{1,3})\s*%")
+PERCENT_PATTERN = re.compile(r"(\d{1,3})[^\S\n]*%")
 KWH_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*kWh\b", re.IGNORECASE)
-COST_PATTERN = re.compile(r"\$[\d,.]+")
+# A digit must follow the "$", and cents are capped at two digits, so OCR noise such
+# as "$..." or "$,," is not taken for a cost.
+COST_PATTERN = re.compile(r"\$\d[\d,]*(?:\.\d{1,2})?")
+_HOURS_PATTERN = re.compile(r"(\d+)\s*hr", re.IGNORECASE)
+_MINUTES_PATTERN = re.compile(r"(\d+)\s*min", re.IGNORECASE)
+# OCR's "Ist" for "1st" and ordinal suffixes ("22nd") in one pattern: group 1 holds the
+# day digits of an ordinal and is unset for "Ist".
+_DAY_TOKEN_PATTERN = re.compile(r"\b(?:[iI]st|(\d{1,2})(?i:st|nd|rd|th))\b")
+_DAYYEAR_PATTERN = re.compile(r"(\d{1,2})\s+(\d{4})")
+_WS_PATTERN = re.compile(r"\s+")
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "january", "february", "march", "april", "may", "june",
+            "july", "august", "september", "october", "november", "december",
+        ),
+        start=1,
+    )
+}
+_FAST_DATE_PATTERN = re.compile(
+    r"(%s)\s+([0-9]{1,2})(?:st|nd|rd|th)?,?\s+([0-9]{4})" % "|".join(_MONTHS),
+    re.IGNORECASE,
+)
+# DATE_PATTERN and TIME_PATTERN fused for one scan of the Additional Details section. A
+# time has no letters and needs a ':' or '.', so neither can start inside the other and
+# the fused scan finds exactly the matches of the two separate scans. The leading
+# lookahead (a digit or a month's first letter) lets the engine reject most positions
+# with one character-class test instead of trying all twelve month names.
+_DATE_TIME_SCAN_PATTERN = re.compile(
+    f"(?=[\\d{''.join(sorted({month[0] for month in _MONTHS}))}])"
+    f"(?:(?P<date>{DATE_PATTERN.pattern})|(?P<time>{TIME_PATTERN.pattern}))",
+    re.IGNORECASE,
+)
+# PERCENT_PATTERN, added miles ("(+86 mi)") and COST_PATTERN fused so a text is scanned
+# once. The cost branch only consumes the "$" so it can never swallow a percentage.
+_TEXT_SCAN_PATTERN = re.compile(
+    r"(?P<pct>\d{1,3})[^\S\n]*%"
+    r"|\((?:\+)?(?P<miles>\d+)[^\S\n]*mi\)"
+    r"|(?P<cost>\$)(?=\d)"
+)
+
+# Leading-digit misreads of the end percentage that get repaired (1→7, 7→1, 1→4, etc.).
+_END_PCT_CORRECTIONS = frozenset((60, 70, 80, -60, -70, -80, 30, 40, 50, -30, -40, -50))
+
+# Labels whose value is looked up with `extract_label_value`.
+LABELS = ("time charging", "energy added", "charge")
+_LABEL_PREFIXES = tuple((label, f"{label} ") for label in LABELS)
+# Section headers located by substring match.
+SECTION_MARKERS = ("summary", "charge details", "additional details")
+_SECTION_MARKER_PATTERN = re.compile("|".join(re.escape(marker) for marker in SECTION_MARKERS))
+
+# Section labels that each add to the FordPass detection score.
+DETECT_TOKENS = ("charge details", "additional details", "energy added", "time charging")
 
 SECTION_BREAKS = [
     "summary",
@@ -26,107 +83,149 @@ SECTION_BREAKS = [
 ]
 
 
+_SECTION_BREAK_SET = frozenset(SECTION_BREAKS)
+_SECTION_BREAK_PREFIXES = tuple(f"{label} " for label in SECTION_BREAKS)
+# Section headers the summary walk steps over instead of stopping at.
+_SUMMARY_SKIP = frozenset(("summary", "charge details"))
+
 
 def lower_is_section_break(lowered: str) -> bool:
-    for label in SECTION_BREAKS:
-        if lowered == label or lowered.startswith(f"{label} "):
-            return True
-    return False
+    return lowered in _SECTION_BREAK_SET or lowered.startswith(_SECTION_BREAK_PREFIXES)
 
 
-def extract_label_value(lines: List[str], label: str) -> str:
-    """Return the text immediately associated with the provided label."""
+def _inline_label_value(line: str, label: str) -> str:
+    """Return the numeric-looking value that follows a label on the same (stripped) line."""
+    # The line has no trailing whitespace, so only the left side needs trimming.
+    inline_value = line[len(label) :].lstrip().lstrip(":").lstrip()
+    if inline_value and not inline_value[0].isdigit() and inline_value[0] not in "+-($":
+        return ""
+    return inline_value
+
+
+def index_lines(lowered: List[str]) -> Dict[str, int]:
+    """
+    Record the first line index of every known label and section marker in one pass.
+
+    Labels use the same matching rules as `extract_label_value`; section markers match
+    anywhere within a line.
+    """
+    index: Dict[str, int] = {}
+    line_starts: List[int] = []
+    offset = 0
+    for idx, lowered_line in enumerate(lowered):
+        line_starts.append(offset)
+        offset += len(lowered_line) + 1
+        if not lowered_line:
+            continue
+        for label, label_space in _LABEL_PREFIXES:
+            if label in index:
+                continue
+            if lowered_line.rstrip(":") == label or (
+                lowered_line.startswith(label_space) and _inline_label_value(lowered_line, label)
+            ):
+                index[label] = idx
+    # All section markers are found by a single alternation scan over the whole text.
+    for match in _SECTION_MARKER_PATTERN.finditer("\n".join(lowered)):
+        index.setdefault(match.group(0), bisect_right(line_starts, match.start()) - 1)
+    return index
+
+
+def extract_label_value(lines: List[str], lowered: List[str], index: Dict[str, int], label: str) -> str:
+    """
+    Return the text immediately associated with the provided label.
+
+    `lines` must already be stripped, `lowered` is its lower-cased twin and `index` comes
+    from `index_lines`.
+    """
     target = label.lower()
-    for idx, line in enumerate(lines):
-        clean = line.strip()
-        if not clean:
+    target_space = target + " "
+    idx = index.get(target)
+    if idx is None:
+        return ""
+    if lowered[idx].rstrip(":") != target:
+        return _inline_label_value(lines[idx], label)
+    for pos in range(idx + 1, len(lines)):
+        follower_lower = lowered[pos]
+        if not follower_lower:
             continue
-        lowered = clean.lower()
-        stripped = lowered.rstrip(":")
-        is_direct_match = stripped == target
-        inline_value = ""
-        if not is_direct_match and lowered.startswith(f"{target} "):
-            inline_value = clean[len(label) :].strip()
-            inline_value = inline_value.lstrip(":").strip()
-            if inline_value and not inline_value[0].isdigit() and inline_value[0] not in "+-($" and inline_value[0] != "(":
-                inline_value = ""
-        if is_direct_match or inline_value:
-            if inline_value:
-                return inline_value
-            for follower in lines[idx + 1 :]:
-                follower = follower.strip()
-                if not follower:
-                    continue
-                follower_lower = follower.lower()
-                if follower_lower == target or follower_lower.startswith(f"{target} "):
-                    continue
-                return follower
-    return ""
-
-
-def find_percentage(lines: List[str], start_idx: int) -> str:
-    """Find the first percentage value at or after the provided index."""
-    for follower in lines[start_idx:]:
-        match = PERCENT_PATTERN.search(follower)
-        if match:
-            return match.group(1)
-    return ""
-
-
-def find_time(lines: List[str], start_idx: int) -> str:
-    """Find the first time value at or after the provided index."""
-    for follower in lines[start_idx:]:
-        match = TIME_PATTERN.search(follower)
-        if match:
-            time_str = match.group(0)
-            # Normalize periods to colons for consistent output
-            return time_str.replace(".", ":")
+        if follower_lower == target or follower_lower.startswith(target_space):
+            continue
+        return lines[pos]
     return ""
 
 
-def extract_section(lines: List[str], label: str) -> List[str]:
+def extract_section(lines: List[str], lowered: List[str], label: str) -> List[str]:
     """Return lines that belong to a section header until the next section break."""
     target = label.lower()
-    for idx, line in enumerate(lines):
-        clean = line.strip()
-        if not clean:
+    target_space = target + " "
+    for idx, lowered_line in enumerate(lowered):
+        if not lowered_line:
             continue
-        lowered = clean.lower()
-        if lowered == target or lowered.startswith(f"{target} "):
+        if lowered_line == target or lowered_line.startswith(target_space):
             section: List[str] = []
-            if lowered.startswith(f"{target} "):
-                inline = clean[len(label) :].strip().lstrip(":").strip()
+            if lowered_line.startswith(target_space):
+                inline = lines[idx][len(label) :].lstrip().lstrip(":").lstrip()
                 if inline:
                     section.append(inline)
-            for follower in lines[idx + 1 :]:
-                follower_clean = follower.strip()
-                if not follower_clean:
+            for pos in range(idx + 1, len(lines)):
+                if not lines[pos]:
                     continue
-                follower_lower = follower_clean.lower()
-                if lower_is_section_break(follower_lower):
+                if lower_is_section_break(lowered[pos]):
                     break
-                section.append(follower_clean)
+                section.append(lines[pos])
             return section
     return []
 
 
+def _month_table_date(text: str) -> Optional[str]:
+    """
+    Convert 'Month D[suffix][,] YYYY' to ISO with the month table, without strptime.
+
+    Returns None when the text isn't in that shape, and "" when it is but names an
+    invalid date (as strptime would also reject it).
+    """
+    match = _FAST_DATE_PATTERN.fullmatch(text)
+    if match is None:
+        return None
+    month, day, year = match.groups()
+    # Case-insensitive matching also accepts Unicode folds such as "ſeptember", which
+    # aren't table keys; leave those to strptime.
+    month_number = _MONTHS.get(month.lower())
+    if month_number is None:
+        return None
+    try:
+        return date(int(year), month_number, int(day)).isoformat()
+    except ValueError:
+        return ""
+
+
+def _normalize_day_token(match: re.Match[str]) -> str:
+    return match.group(1) or "1"
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_date_to_iso(date_text: str) -> str:
     """Normalize and convert textual dates like 'December Ist, 2025' to ISO."""
     if not date_text:
         return ""
 
-    def _normalize_day_token(text: str) -> str:
-        text = re.sub(r"\b[iI]st\b", "1", text)
-        text = re.sub(r"\b(\d{1,2})(st|nd|rd|th)\b", r"\1", text, flags=re.IGNORECASE)
-        return text
+    # Fast path for the common "December 16, 2025" / "December 1st 2025" shapes.
+    fast = _month_table_date(date_text)
+    if fast is not None:
+        return fast
 
-    normalized = _normalize_day_token(date_text)
+    normalized = _DAY_TOKEN_PATTERN.sub(_normalize_day_token, date_text)
     normalized = normalized.replace(" ,", ",")
-    normalized = re.sub(r"\s+", " ", normalized.strip())
+    normalized = _WS_PATTERN.sub(" ", normalized.strip())
 
-    # Ensure there is a comma between day and year for consistent parsing.
-    normalized = re.sub(r"(\d{1,2})\s+(\d{4})", r"\1, \2", normalized)
+    # Normalization usually leaves the plain shape the month table handles (with or
+    # without the comma); strptime only sees what is left (e.g. non-ASCII digits).
+    fast = _month_table_date(normalized)
+    if fast is not None:
+        return fast
 
+    # Ensure there is a comma between day and year for consistent parsing.
+    normalized = _DAYYEAR_PATTERN.sub(r"\1, \2", normalized)
     for fmt in ("%B %d, %Y", "%B %d %Y"):
         try:
             dt = datetime.strptime(normalized, fmt)
@@ -136,12 +235,10 @@ def parse_date_to_iso(date_text: str) -> str:
     return ""
 
 
-def extract_additional_details(lines: List[str]) -> Dict[str, str]:
-    """Pull start/end metadata from the Additional Details section."""
-    additional_idx = next(
-        (idx for idx, line in enumerate(lines) if "additional details" in line.lower()),
-        None,
-    )
+def extract_additional_details(
+    lines: List[str], lowered: List[str], additional_idx: Optional[int]
+) -> Dict[str, str]:
+    """Pull start/end metadata from the Additional Details section starting at `additional_idx`."""
     if additional_idx is None:
         return {
             "start_date": "",
@@ -151,7 +248,7 @@ def extract_additional_details(lines: List[str]) -> Dict[str, str]:
             "start_pct": "",
             "end_pct": "",
         }
-    section = [line.strip() for line in lines[additional_idx + 1 :]]
+    start = additional_idx + 1
     result = {
         "start_date": "",
         "end_date": "",
@@ -160,15 +257,49 @@ def extract_additional_details(lines: List[str]) -> Dict[str, str]:
         "start_pct": "",
         "end_pct": "",
     }
+
+    # Scan the whole section once for dates and times and once for percentages (which
+    # can overlap a time, as in "12:30%"), then look matches up by character offset.
+    # None of the patterns can match across a newline, so every hit belongs to one line.
+    # The section is addressed by index from `start` rather than copied out of `lines`;
+    # line_starts[pos - start] is the offset of lines[pos] in the blob.
+    blob = "\n".join(islice(lines, start, None))
+    line_starts: List[int] = []
+    offset = 0
+    for pos in range(start, len(lines)):
+        line_starts.append(offset)
+        offset += len(lines[pos]) + 1
+    date_hits: List[re.Match[str]] = []
+    time_hits: List[re.Match[str]] = []
+    for match in _DATE_TIME_SCAN_PATTERN.finditer(blob):
+        (date_hits if match.lastgroup == "date" else time_hits).append(match)
+    date_starts = [match.start() for match in date_hits]
+    time_starts = [match.start() for match in time_hits]
+    pct_hits = list(PERCENT_PATTERN.finditer(blob)) if "%" in blob else []
+    pct_starts = [match.start() for match in pct_hits]
+
+    def first_hit(
+        hits: List[re.Match[str]], starts: List[int], position: int, limit: Optional[int] = None
+    ) -> Optional[re.Match[str]]:
+        hit_idx = bisect_left(starts, position)
+        if hit_idx == len(hits):
+            return None
+        if limit is not None and starts[hit_idx] >= limit:
+            return None
+        return hits[hit_idx]
+
     current_date = ""
     pending_time = ""
-    for idx, line in enumerate(section):
+    for pos in range(start, len(lines)):
+        line = lines[pos]
         if not line:
             continue
-        date_match = DATE_PATTERN.search(line)
+        line_start = line_starts[pos - start]
+        line_end = line_start + len(line)
+        date_match = first_hit(date_hits, date_starts, line_start, line_end)
+        time_match = first_hit(time_hits, time_starts, line_start, line_end)
         if date_match:
             current_date = parse_date_to_iso(date_match.group(0))
-            time_match = TIME_PATTERN.search(line)
             if time_match:
                 # Normalize periods to colons for consistent output
                 pending_time = time_match.group(0).replace(".", ":")
@@ -177,43 +308,35 @@ def extract_additional_details(lines: List[str]) -> Dict[str, str]:
             continue
 
         # Check if line is a standalone time (EasyOCR often splits date and time)
-        time_match = TIME_PATTERN.search(line)
-        if time_match and time_match.group(0).strip() == line.strip():
+        if time_match and time_match.start() == line_start and time_match.end() == line_end:
             # This line contains only a time, save it as pending
             pending_time = time_match.group(0).replace(".", ":")
             continue
 
-        lowered = line.lower()
-        if lowered.startswith("start"):
-            if not result["start_date"]:
-                result["start_date"] = current_date
-            if not result["start_time"]:
-                time_value = pending_time or find_time(section, idx)
-                result["start_time"] = time_value
-            if not result["start_pct"]:
-                result["start_pct"] = find_percentage(section, idx)
-            pending_time = ""
-        elif lowered.startswith("end"):
-            if not result["end_date"]:
-                result["end_date"] = current_date
-            if not result["end_time"]:
-                time_value = pending_time or find_time(section, idx)
-                result["end_time"] = time_value
-            if not result["end_pct"]:
-                result["end_pct"] = find_percentage(section, idx)
-            pending_time = ""
+        lowered_line = lowered[pos]
+        if lowered_line.startswith("start"):
+            key = "start"
+        elif lowered_line.startswith("end"):
+            key = "end"
+        else:
+            continue
+        if not result[f"{key}_date"]:
+            result[f"{key}_date"] = current_date
+        if not result[f"{key}_time"]:
+            next_time = first_hit(time_hits, time_starts, line_start)
+            result[f"{key}_time"] = pending_time or (next_time.group(0).replace(".", ":") if next_time else "")
+        if not result[f"{key}_pct"]:
+            next_pct = first_hit(pct_hits, pct_starts, line_start)
+            result[f"{key}_pct"] = next_pct.group(1) if next_pct else ""
+        pending_time = ""
     return result
 
 
 def extract_brand(charger_name: str) -> str:
     """Guess the charger brand from the leading token of the charger name."""
-    if not charger_name:
-        return ""
-    for token in re.split(r"[\s\-]+", charger_name):
-        token = token.strip()
-        if token:
-            return token
-    return ""
+    # Hyphens separate tokens like whitespace does; split(None, 1) stops after the first.
+    parts = charger_name.replace("-", " ").split(None, 1)
+    return parts[0] if parts else ""
 
 
 def parse_duration_minutes(duration_text: str) -> str:
@@ -222,10 +345,10 @@ def parse_duration_minutes(duration_text: str) -> str:
         return ""
     hours = 0
     minutes = 0
-    hour_match = re.search(r"(\d+)\s*hr", duration_text, flags=re.IGNORECASE)
+    hour_match = _HOURS_PATTERN.search(duration_text)
     if hour_match:
         hours = int(hour_match.group(1))
-    minute_match = re.search(r"(\d+)\s*min", duration_text, flags=re.IGNORECASE)
+    minute_match = _MINUTES_PATTERN.search(duration_text)
     if minute_match:
         minutes = int(minute_match.group(1))
     total = hours * 60 + minutes
@@ -234,18 +357,31 @@ def parse_duration_minutes(duration_text: str) -> str:
 
 def extract_record_from_text(text: str) -> Dict[str, str]:
     """Parse OCR text into the CSV-ready dictionary."""
-    lines = [line.strip() for line in text.splitlines()]
-    additional_idx = next((idx for idx, line in enumerate(lines) if "additional details" in line.lower()), None)
+    # Identical OCR text (re-runs, duplicate screenshots) is only parsed once. The cache
+    # holds immutable items, so every caller gets a dict of its own to modify.
+    return dict(_record_items(text))
+
+
+@functools.lru_cache(maxsize=256)
+def _record_items(text: str) -> Tuple[Tuple[str, str], ...]:
+    return tuple(_parse_record(text).items())
+
+
+def _parse_record(text: str) -> Dict[str, str]:
+    # Blank lines never carry a label, value or section marker, and none of the patterns
+    # match across a newline, so dropping them up front leaves every lookup unchanged.
+    lines = [line for line in map(str.strip, text.splitlines()) if line]
+    lowered = [line.lower() for line in lines]
+    index = index_lines(lowered)
+    additional_idx = index.get("additional details")
 
     def extract_summary_info(start_idx: int) -> tuple[str, str]:
         summary_lines: List[str] = []
-        for candidate in lines[start_idx:]:
-            clean = candidate.strip()
-            if not clean:
-                continue
-            lowered = clean.lower()
-            if lower_is_section_break(lowered):
-                if lowered in {"summary", "charge details"}:
+        for pos in range(start_idx, len(lines)):
+            clean = lines[pos]
+            lowered_line = lowered[pos]
+            if lower_is_section_break(lowered_line):
+                if lowered_line in _SUMMARY_SKIP:
                     continue
                 break
             summary_lines.append(clean)
@@ -255,11 +391,11 @@ def extract_record_from_text(text: str) -> Dict[str, str]:
 
         # Use the last line as the address, everything before as the name
         if len(summary_lines) >= 2:
-            location = summary_lines[-1].strip()
-            name = " ".join(summary_lines[:-1]).strip()
+            location = summary_lines[-1]
+            name = " ".join(summary_lines[:-1])
         elif len(summary_lines) == 1:
             # Only one line - treat it as the name
-            name = summary_lines[0].strip()
+            name = summary_lines[0]
             location = ""
         else:
             name = ""
@@ -267,54 +403,59 @@ def extract_record_from_text(text: str) -> Dict[str, str]:
 
         return name, location
 
-    summary_idx = next((i for i, l in enumerate(lines) if "summary" in l.lower()), None)
+    summary_idx = index.get("summary")
     charger_name = ""
     charger_location = ""
     if summary_idx is not None:
         charger_name, charger_location = extract_summary_info(summary_idx + 1)
     if not charger_name:
-        details_idx = next((i for i, l in enumerate(lines) if "charge details" in l.lower()), None)
+        details_idx = index.get("charge details")
         if details_idx is not None:
             charger_name, charger_location = extract_summary_info(details_idx + 1)
 
-    duration = extract_label_value(lines, "time charging")
+    duration = extract_label_value(lines, lowered, index, "time charging")
     duration_minutes = parse_duration_minutes(duration)
-    kwh_text = extract_label_value(lines, "energy added")
+    kwh_text = extract_label_value(lines, lowered, index, "energy added")
     kwh_match = KWH_PATTERN.search(kwh_text)
     kwh_added = kwh_match.group(1) if kwh_match else ""
 
-    charge_text = extract_label_value(lines, "charge")
+    charge_text = extract_label_value(lines, lowered, index, "charge")
     if not charge_text:
-        charge_section = extract_section(lines, "charge")
+        charge_section = extract_section(lines, lowered, "charge")
         if charge_section:
             charge_text = charge_section[0]
     charge_pct = ""
     charge_miles = ""
     if charge_text:
-        pct_match = PERCENT_PATTERN.search(charge_text)
-        if pct_match:
-            charge_pct = pct_match.group(1)
-        miles_match = re.search(r"\((?:\+)?(\d+)\s*mi\)", charge_text)
-        if miles_match:
-            charge_miles = miles_match.group(1)
-    if not charge_pct or not charge_miles:
-        scan_limit = additional_idx if additional_idx is not None else len(lines)
-        for line in lines[:scan_limit]:
-            if not charge_pct:
-                pct_match = PERCENT_PATTERN.search(line)
-                if pct_match:
-                    charge_pct = pct_match.group(1)
-            if not charge_miles:
-                miles_match = re.search(r"\((?:\+)?(\d+)\s*mi\)", line)
-                if miles_match:
-                    charge_miles = miles_match.group(1)
+        for match in _TEXT_SCAN_PATTERN.finditer(charge_text):
+            if match.lastgroup == "pct" and not charge_pct:
+                charge_pct = match.group("pct")
+            elif match.lastgroup == "miles" and not charge_miles:
+                charge_miles = match.group("miles")
             if charge_pct and charge_miles:
                 break
-
-    cost_match = COST_PATTERN.search(text)
-    cost_value = cost_match.group(0) if cost_match else ""
-
-    additional = extract_additional_details(lines)
+    # One pass over the text finds the cost and, if the Charge label didn't yield them,
+    # the first charge percentage/miles before the Additional Details section.
+    scan_limit = additional_idx if additional_idx is not None else len(lines)
+    scan_end = sum(map(len, islice(lines, scan_limit))) + scan_limit
+    first_hits: Dict[str, re.Match[str]] = {}
+    for match in _TEXT_SCAN_PATTERN.finditer("\n".join(lines)):
+        first_hits.setdefault(match.lastgroup or "", match)
+        if len(first_hits) == 3:
+            break
+    if not charge_pct and "pct" in first_hits and first_hits["pct"].start() < scan_end:
+        charge_pct = first_hits["pct"].group("pct")
+    if not charge_miles and "miles" in first_hits and first_hits["miles"].start() < scan_end:
+        charge_miles = first_hits["miles"].group("miles")
+
+    cost_value = ""
+    if "cost" in first_hits:
+        cost_hit = first_hits["cost"]
+        cost_match = COST_PATTERN.match(cost_hit.string, cost_hit.start())
+        if cost_match is not None:
+            cost_value = cost_match.group(0)
+
+    additional = extract_additional_details(lines, lowered, additional_idx)
     date_value = additional["start_date"] or additional["end_date"] or ""
     start_time = additional["start_time"]
     end_time = additional["end_time"]
@@ -330,14 +471,10 @@ def extract_record_from_text(text: str) -> Dict[str, str]:
             charge_val = int(charge_pct)
             expected_end = start_val + charge_val
 
-            # Check if OCR misread a leading digit (e.g., "79" as "19", "78" as "18")
-            if abs(expected_end - end_val) >= 10:
-                # Try common OCR errors: 1→7, 7→1, 1→4, etc.
-                for correction in [60, 70, 80, -60, -70, -80, 30, 40, 50, -30, -40, -50]:
-                    corrected_end = end_val + correction
-                    if corrected_end == expected_end and 0 <= corrected_end <= 100:
-                        end_pct = str(corrected_end)
-                        break
+            # Check if OCR misread a leading digit (e.g., "79" as "19", "78" as "18"): at most
+            # one correction can land on the expected value, so test the difference directly.
+            if expected_end - end_val in _END_PCT_CORRECTIONS and 0 <= expected_end <= 100:
+                end_pct = str(expected_end)
         except (ValueError, TypeError):
             pass
 
@@ -362,18 +499,9 @@ def extract_record_from_text(text: str) -> Dict[str, str]:
 class FordPassPlugin(ChargingAppPlugin):
     name = "fordpass"
     display_name = "FordPass"
-
-    def detect(self, text: str) -> float:
-        lowered = text.lower()
-        score = 0.0
-        if "fordpass" in lowered or "ford pass" in lowered:
-            score += 2.0
-        for token in ("charge details", "additional details", "energy added", "time charging"):
-            if token in lowered:
-                score += 0.5
-        if "summary" in lowered:
-            score += 0.25
-        return score
+    keywords = ("fordpass",) + DETECT_TOKENS + ("summary",)
+    weights = {"fordpass": 2.0, "summary": 0.25, **{token: 0.5 for token in DETECT_TOKENS}}
+    aliases = {"ford pass": "fordpass"}
 
     def parse(self, text: str) -> Dict[str, str]:
         return extract_record_from_text(text)
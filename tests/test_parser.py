@@ -1,22 +1,43 @@
+import contextlib
 import csv
+import gc
+import os
+import subprocess
 import sys
 import tempfile
+import threading
 import unittest
+from datetime import datetime
+from multiprocessing.connection import Client
 from pathlib import Path
+from unittest import mock
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+import charge_parser
 from charge_parser import (
+    EASYOCR_BATCH_SIZE,
+    ChargingAppPlugin,
     FordPassPlugin,
+    _parse_row_datetime,
     available_plugins,
     extract_record_from_text,
     gather_image_paths,
+    get_plugin_by_name,
+    load_image,
     pick_plugin_from_scores,
+    run_easyocr_batch,
+    run_easyocr_via_daemon,
+    run_ocr_many,
+    run_tesseract_batch,
     score_plugins,
+    serve_easyocr,
     write_csv,
 )
+from plugins import base as plugins_base
+from plugins.fordpass import parse_date_to_iso
 
 
 SAMPLE_TEXT = """
@@ -216,6 +237,20 @@ class ParserTestCase(unittest.TestCase):
         self.assertEqual(record["charge_percentage"], "69")
         self.assertEqual(record["charge_miles"], "180")
 
+    def test_parse_date_normalizes_ocr_day_tokens(self) -> None:
+        self.assertEqual(parse_date_to_iso("December Ist , 2025"), "2025-12-01")
+        self.assertEqual(parse_date_to_iso("December 22nd, 2025"), "2025-12-22")
+
+    def test_parse_date_rejects_invalid_dates(self) -> None:
+        self.assertEqual(parse_date_to_iso("February 30, 2025"), "")
+        # The case-insensitive month pattern accepts Unicode case folds such as the long s,
+        # which are not real month names.
+        self.assertEqual(parse_date_to_iso("\u017feptember 1, 2025"), "")
+
+    def test_cost_skips_ocr_noise_after_dollar_sign(self) -> None:
+        record = extract_record_from_text(SAMPLE_TEXT + "\nFees $...\nTotal $1,234.567\n")
+        self.assertEqual(record["cost"], "$1,234.56")
+
 
 class GatherImagesTestCase(unittest.TestCase):
     def test_collects_images_from_directory(self) -> None:
@@ -232,7 +267,63 @@ class GatherImagesTestCase(unittest.TestCase):
 
             collected = gather_image_paths([base])
 
-            self.assertEqual(collected, [img1.resolve(), img2.resolve()])
+            self.assertEqual(collected, [img1, img2])
+
+    def test_dedups_same_file_reached_twice(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            img = base / "one.png"
+            img.write_bytes(b"a")
+
+            collected = gather_image_paths([img, base, base / "." / "one.png"])
+
+            self.assertEqual(collected, [img])
+
+    def test_dedups_explicit_file_when_directory_inode_differs(self) -> None:
+        # Some filesystems report a d_ino in directory listings that differs from st_ino.
+        class OtherInodeEntry:
+            def __init__(self, entry: os.DirEntry) -> None:
+                self._entry = entry
+
+            def __getattr__(self, name: str):
+                return getattr(self._entry, name)
+
+            def inode(self) -> int:
+                return self._entry.inode() + 1
+
+        real_scandir = os.scandir
+
+        @contextlib.contextmanager
+        def scandir(path):
+            with real_scandir(path) as entries:
+                yield [OtherInodeEntry(entry) for entry in entries]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            img = base / "one.png"
+            img.write_bytes(b"a")
+
+            with mock.patch("charge_parser.os.scandir", scandir):
+                collected = gather_image_paths([img, base])
+
+            self.assertEqual(collected, [img])
+
+    def test_skips_looping_symlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "shots"
+            base.mkdir()
+            img = base / "a.png"
+            img.write_bytes(b"a")
+            (base / "self").symlink_to("self")
+            (base / "loop").symlink_to("..")
+            nested = base / "nested"
+            nested.mkdir()
+            (nested / "up").symlink_to("..")
+
+            collected = gather_image_paths([base])
+
+            self.assertEqual(collected, [img])
+
 
 
 class CsvWriteTestCase(unittest.TestCase):
@@ -285,6 +376,167 @@ class CsvWriteTestCase(unittest.TestCase):
                 ["Location A", "Location B", "Location A"],
             )
 
+    def test_append_to_out_of_order_file_sorts_everything(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = Path(tmp) / "charges.csv"
+            with output_path.open("w", newline="", encoding="utf-8") as handle:
+                writer = csv.DictWriter(handle, fieldnames=["date", "charger_location", "start_time"])
+                writer.writeheader()
+                writer.writerow({"date": "2025-12-20", "charger_location": "C", "start_time": "08:00"})
+                writer.writerow({"date": "2025-12-01", "charger_location": "A", "start_time": "9:05 PM"})
+
+            added = write_csv(
+                output_path, [{"date": "2025-12-10", "charger_location": "B", "start_time": "07:30"}], append=True
+            )
+            self.assertEqual(added, 1)
+
+            with output_path.open(newline="", encoding="utf-8") as handle:
+                rows = list(csv.DictReader(handle))
+            self.assertEqual([row["charger_location"] for row in rows], ["A", "B", "C"])
+
+    def test_row_datetime_accepts_other_time_shapes(self) -> None:
+        self.assertEqual(_parse_row_datetime("2025-12-16", "9:05 PM"), datetime(2025, 12, 16, 21, 5))
+        self.assertEqual(_parse_row_datetime("2025-12-16", "12:30:15"), datetime(2025, 12, 16, 12, 30, 15))
+
+
+class TesseractBatchTestCase(unittest.TestCase):
+    def test_splits_batch_output_per_image(self) -> None:
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"first\x0csecond\x0c")
+        with mock.patch("charge_parser.subprocess.run", return_value=completed) as run:
+            texts = run_tesseract_batch([Path("a.png"), Path("b.png")], "6")
+        self.assertEqual(texts, ["first", "second"])
+        self.assertEqual(run.call_count, 1)
+
+    def test_falls_back_to_single_runs_when_pages_missing(self) -> None:
+        batch = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"only one page")
+        single = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"text")
+        with mock.patch("charge_parser.subprocess.run", side_effect=[batch, single, single]) as run:
+            texts = run_tesseract_batch([Path("a.png"), Path("b.png")], "6")
+        self.assertEqual(texts, ["text", "text"])
+        self.assertEqual(run.call_count, 3)
+
+    def test_falls_back_to_single_runs_when_extra_pages(self) -> None:
+        # A multi-page TIFF adds pages, which would shift every later image's text.
+        batch = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"p1\x0cp2\x0cb\x0c")
+        single = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"text")
+        with mock.patch("charge_parser.subprocess.run", side_effect=[batch, single, single]) as run:
+            texts = run_tesseract_batch([Path("a.tif"), Path("b.png")], "6")
+        self.assertEqual(texts, ["text", "text"])
+        self.assertEqual(run.call_count, 3)
+
+
+class EasyOcrBatchTestCase(unittest.TestCase):
+    def test_loads_file_contents_for_easyocr_to_decode(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            image = Path(tmp) / "shot.png"
+            image.write_bytes(b"\x89PNG not really")
+            self.assertEqual(load_image(image), b"\x89PNG not really")
+
+    def test_joins_batched_results_per_image(self) -> None:
+        reader = mock.Mock()
+        reader.readtext_batched.return_value = [["Charge", "29%"], ["Summary"]]
+        with mock.patch("charge_parser.get_easyocr_reader", return_value=reader):
+            texts = run_easyocr_batch([Path("a.png"), Path("b.png")], batch_size=2)
+        self.assertEqual(texts, ["Charge\n29%", "Summary"])
+        self.assertEqual(reader.readtext_batched.call_args.kwargs["batch_size"], 2)
+
+    def test_loads_and_recognizes_one_batch_at_a_time(self) -> None:
+        reader = mock.Mock()
+        reader.readtext_batched.side_effect = lambda images, **kwargs: [[image.decode()] for image in images]
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for number in range(EASYOCR_BATCH_SIZE + 4):
+                path = Path(tmp) / f"{number}.png"
+                path.write_bytes(str(number).encode())
+                paths.append(path)
+            with mock.patch("charge_parser.EASYOCR_AVAILABLE", True), mock.patch(
+                "charge_parser.get_easyocr_reader", return_value=reader
+            ):
+                texts = run_ocr_many(paths, "6")
+        self.assertEqual(texts, [str(number) for number in range(EASYOCR_BATCH_SIZE + 4)])
+        self.assertEqual(
+            [len(call.args[0]) for call in reader.readtext_batched.call_args_list], [EASYOCR_BATCH_SIZE, 4]
+        )
+
+
+class OcrDaemonTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.reader = mock.Mock()
+        self.reader.readtext.return_value = ["Charge", "29%"]
+        for patcher in (
+            mock.patch("charge_parser.EASYOCR_AVAILABLE", True),
+            mock.patch("charge_parser.get_easyocr_reader", return_value=self.reader),
+            # Never spawn a real daemon; the client retries until the test server listens.
+            mock.patch("charge_parser.subprocess.Popen"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.address = str(self.tmp / "ocr.sock")
+
+    def start_server(self, idle_timeout: float = 1) -> threading.Thread:
+        server = threading.Thread(target=serve_easyocr, args=(self.address, idle_timeout), daemon=True)
+        server.start()
+        self.addCleanup(server.join, 10)
+        return server
+
+    def test_sends_absolute_paths_to_daemon(self) -> None:
+        # The daemon's working directory is the script's, not the caller's.
+        (self.tmp / "shots").mkdir()
+        (self.tmp / "shots" / "a.png").write_bytes(b"a")
+        self.start_server()
+        received = []
+
+        def record_paths(paths, psm):
+            received.extend(paths)
+            return original_run_ocr_many(paths, psm)
+
+        original_run_ocr_many = charge_parser.run_ocr_many
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        try:
+            with mock.patch("charge_parser.run_ocr_many", side_effect=record_paths):
+                texts = run_easyocr_via_daemon([Path("shots/a.png")], address=self.address)
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(texts, ["Charge\n29%"])
+        self.assertEqual(received, [(self.tmp / "shots" / "a.png").resolve()])
+
+    def test_daemon_survives_bad_clients(self) -> None:
+        image = self.tmp / "a.png"
+        image.write_bytes(b"a")
+        client_gone = threading.Event()
+        self.reader.readtext.side_effect = lambda *args, **kwargs: client_gone.wait(5) and ["x"]
+        self.start_server(idle_timeout=2)
+
+        # Disconnects while its image is being recognized, so the reply hits a closed socket.
+        conn = charge_parser._connect_to_daemon(self.address)
+        conn.send([str(image)])
+        conn.close()
+        client_gone.set()
+        # Sends something that is not a pickle.
+        with Client(self.address, family="AF_UNIX") as conn:
+            conn.send_bytes(b"not a pickle")
+
+        self.assertEqual(run_easyocr_via_daemon([image], address=self.address), ["x"])
+
+    def test_second_daemon_leaves_running_one_alone(self) -> None:
+        first = self.start_server(idle_timeout=1)
+        charge_parser._connect_to_daemon(self.address).close()
+        socket_inode = os.stat(self.address).st_ino
+
+        second = threading.Thread(target=serve_easyocr, args=(self.address, 30), daemon=True)
+        second.start()
+        second.join(10)
+        self.assertFalse(second.is_alive())
+        self.assertEqual(os.stat(self.address).st_ino, socket_inode)
+
+        first.join(10)
+        self.assertFalse(first.is_alive())
+        self.assertFalse(os.path.exists(self.address))
+
 
 class PluginDetectionTestCase(unittest.TestCase):
     def test_detects_fordpass_plugin(self) -> None:
@@ -293,6 +545,36 @@ class PluginDetectionTestCase(unittest.TestCase):
         plugin = pick_plugin_from_scores(scores)
         self.assertIsInstance(plugin, FordPassPlugin)
 
+    def test_keyword_detection_counts_each_keyword_once(self) -> None:
+        plugin = FordPassPlugin()
+        text = "FordPass\nFord Pass\nSummary\nEnergy added\nEnergy added"
+        self.assertEqual(plugin.detect(text), 2.75)
+        self.assertEqual(score_plugins(text, [plugin]), [(2.75, plugin)])
+
+    def test_scores_plugins_with_text_only_detect(self) -> None:
+        # Plugins written against the original interface define detect(self, text).
+        class TextOnlyPlugin(ChargingAppPlugin):
+            name = "text_only_test"
+
+            def detect(self, text: str) -> float:
+                return 1.0 if "text only app" in text.lower() else 0.0
+
+        # Drop every reference scoring keeps, so the class leaves
+        # ChargingAppPlugin.__subclasses__() and later discovery never sees it.
+        # Cleanups run last-in first-out: collect after the caches are cleared.
+        self.addCleanup(gc.collect)
+        self.addCleanup(plugins_base._keyword_automaton.cache_clear)
+        self.addCleanup(plugins_base._DETECT_ACCEPTS_LOWERED.pop, TextOnlyPlugin, None)
+
+        plugin = TextOnlyPlugin()
+        self.assertEqual(score_plugins("Text Only App", [plugin]), [(1.0, plugin)])
+
+    def test_get_plugin_by_name_without_plugin_list(self) -> None:
+        plugin = get_plugin_by_name("FordPass")
+        self.assertIsInstance(plugin, FordPassPlugin)
+        self.assertIs(plugin, get_plugin_by_name("fordpass", available_plugins()))
+        self.assertIsNone(get_plugin_by_name("no_such_app"))
+
     def test_detection_returns_none_for_unknown_app(self) -> None:
         plugins = available_plugins()
         scores = score_plugins("unknown text without markers", plugins)